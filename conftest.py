@@ -0,0 +1,6 @@
+# pytest configuration shared by all the tests
+
+import matplotlib
+
+# the tests must be able to draw plots without a display
+matplotlib.use("Agg")
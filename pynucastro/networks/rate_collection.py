@@ -4,24 +4,50 @@ rates that together make up a network."""
 # Common Imports
 from __future__ import print_function
 
-import functools
 import math
-from operator import mul
 import os
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from collections.abc import MutableMapping
 
+from IPython.display import display
 from ipywidgets import interact
 
+import numpy as np
+
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 #from mpl_toolkits.axes_grid1 import make_axes_locatable
 import networkx as nx
 
 # Import Rate
-from pynucastro.rates import Rate, Nucleus, Library
+from pynucastro.rates import Rate, Nucleus, Library, Tfactors
 
 mpl.rcParams['figure.dpi'] = 100
 
+
+class _MassFractions(MutableMapping):
+    """a dictionary-like view of the mass fractions stored in a
+    Composition, keyed on Nucleus objects"""
+
+    def __init__(self, comp):
+        self._comp = comp
+
+    def __getitem__(self, nuc):
+        return self._comp.X_arr[self._comp._index[nuc.raw]]
+
+    def __setitem__(self, nuc, xval):
+        self._comp.X_arr[self._comp._index[nuc.raw]] = xval
+
+    def __delitem__(self, nuc):
+        raise TypeError("nuclei cannot be removed from a Composition")
+
+    def __iter__(self):
+        return iter(self._comp._nuclei)
+
+    def __len__(self):
+        return len(self._comp._nuclei)
+
+
 class Composition(object):
     """a composition holds the mass fractions of the nuclei in a network
     -- useful for evaluating the rates
@@ -32,58 +58,86 @@ class Composition(object):
         if not isinstance(nuclei[0], Nucleus):
             raise ValueError("must supply an iterable of Nucleus objects")
         else:
-            self.X = {k: small for k in nuclei}
+            self._nuclei = tuple(OrderedDict.fromkeys(nuclei))
+            # index into X_arr of each nucleus, keyed on its name
+            self._index = {k.raw: i for i, k in enumerate(self._nuclei)}
+            self._A = np.array([k.A for k in self._nuclei], dtype=np.float64)
+            self.X_arr = np.full(len(self._nuclei), small, dtype=np.float64)
+
+    @property
+    def X(self):
+        """ the mass fractions, as a dictionary-like object keyed on Nucleus """
+        return _MassFractions(self)
+
+    @X.setter
+    def X(self, xvals):
+        """ set the mass fractions from a dictionary keyed on Nucleus.
+        Only the nuclei in xvals are changed, and they must already be
+        part of the composition. """
+        for k, xval in xvals.items():
+            self.X_arr[self._index[k.raw]] = xval
 
     def set_solar_like(self, Z=0.02):
         """ approximate a solar abundance, setting p to 0.7, He4 to 0.3 - Z and
         the remainder evenly distributed with Z """
-        num = len(self.X)
+        num = len(self._nuclei)
         rem = Z/(num-2)
-        for k in self.X:
-            if k == Nucleus("p"):
-                self.X[k] = 0.7
-            elif k.raw == "he4":
-                self.X[k] = 0.3 - Z
-            else:
-                self.X[k] = rem
+
+        self.X_arr[:] = rem
+
+        i_he4 = self._index.get("he4")
+        if i_he4 is not None:
+            self.X_arr[i_he4] = 0.3 - Z
+
+        # the protons may be named either p or h1
+        i_p = self._index.get("p", self._index.get("h1"))
+        if i_p is not None:
+            self.X_arr[i_p] = 0.7
 
         self.normalize()
 
     def set_all(self, xval):
         """ set all species to a particular value """
-        for k in self.X:
-            self.X[k] = xval
+        self.X_arr[:] = xval
 
     def set_nuc(self, name, xval):
         """ set nuclei name to the mass fraction xval """
-        for k in self.X:
-            if k.raw == name:
-                self.X[k] = xval
-                break
+        i = self._index.get(name)
+        if i is not None:
+            self.X_arr[i] = xval
 
     def normalize(self):
         """ normalize the mass fractions to sum to 1 """
-        X_sum = sum([self.X[k] for k in self.X])
-
-        for k in self.X:
-            self.X[k] /= X_sum
+        self.X_arr /= self.X_arr.sum()
 
     def get_molar(self):
         """ return a dictionary of molar fractions"""
-        molar_frac = {k: v/k.A for k, v in self.X.items()}
-        return molar_frac
+        return dict(zip(self._nuclei, self.get_molar_array()))
+
+    def get_molar_array(self):
+        """ return the molar fractions as an array, ordered like the
+        nuclei used to create the composition """
+        return self.X_arr / self._A
 
     def __str__(self):
-        ostr = ""
-        for k in self.X:
-            ostr += "  X({}) : {}\n".format(k, self.X[k])
-        return ostr
+        return "".join("  X({}) : {}\n".format(k, xval)
+                       for k, xval in zip(self._nuclei, self.X_arr))
+
 
 class RateCollection(object):
     """ a collection of rates that together define a network """
 
     pynucastro_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 
+    # maximum number of (rho, T, composition) states remembered by
+    # evaluate_rates
+    eval_cache_size = 1024
+
+    # range of log10(T) and number of points of the tabulation of the
+    # rates used by evaluate_rates when use_table=True
+    rate_table_logT = (7.0, 10.0)
+    rate_table_npts = 301
+
     def __init__(self, rate_files=None, libraries=None, rates=None):
         """
         rate_files are the files that together define the network.  This
@@ -104,6 +158,11 @@ class RateCollection(object):
         self.rates = []
         self.library = None
 
+        self._eval_cache = {}
+        self._comp_reactant_idx = {}
+        self._rate_table = None
+        self._rate_table_zero = None
+
         if rate_files:
             if isinstance(rate_files, str):
                 rate_files = [rate_files]
@@ -144,21 +203,24 @@ class RateCollection(object):
             self.rates = self.rates + self.library.get_rates()
 
         # get the unique nuclei
-        u = []
-        for r in self.rates:
-            t = set(r.reactants + r.products)
-            u = set(list(u) + list(t))
-
-        self.unique_nuclei = sorted(u)
+        self.unique_nuclei = sorted(set().union(*(r.reactants + r.products for r in self.rates)))
 
         # now make a list of each rate that touches each nucleus
         # we'll store this in a dictionary keyed on the nucleus
+        consumed = defaultdict(list)
+        produced = defaultdict(list)
+        for r in self.rates:
+            for n in set(r.reactants):
+                consumed[n].append(r)
+            for n in set(r.products):
+                produced[n].append(r)
+
         self.nuclei_consumed = OrderedDict()
         self.nuclei_produced = OrderedDict()
 
         for n in self.unique_nuclei:
-            self.nuclei_consumed[n] = [r for r in self.rates if n in r.reactants]
-            self.nuclei_produced[n] = [r for r in self.rates if n in r.products]
+            self.nuclei_consumed[n] = consumed[n]
+            self.nuclei_produced[n] = produced[n]
 
         # Re-order self.rates so Reaclib rates come first,
         # followed by Tabular rates. This is needed if
@@ -166,21 +228,77 @@ class RateCollection(object):
         # in the Fortran network.
         # It is desired to avoid wasting array size
         # storing meaningless Tabular coefficient pointers.
-        self.rates = sorted(self.rates,
-                            key=lambda r: r.chapter == 't')
-
-        self.tabular_rates = []
-        self.reaclib_rates = []
-        for n, r in enumerate(self.rates):
+        reaclib = []
+        tabular = []
+        for r in self.rates:
             if r.chapter == 't':
-                self.tabular_rates.append(n)
+                tabular.append(r)
             elif isinstance(r.chapter, int):
-                self.reaclib_rates.append(n)
+                reaclib.append(r)
             else:
                 print('ERROR: Chapter type unknown for rate chapter {}'.format(
                     str(r.chapter)))
                 exit()
 
+        self.rates = reaclib + tabular
+        self.reaclib_rates = list(range(len(reaclib)))
+        self.tabular_rates = list(range(len(reaclib), len(self.rates)))
+
+        self._setup_rate_arrays()
+
+        # the rates don't change after this point, so we can check once
+        # whether they are distinguishable by name
+        self._distinguishable = len({r.fname for r in self.rates}) == len(self.rates)
+
+        self._setup_plot_topology()
+
+    def _setup_rate_arrays(self):
+        """store the rate properties needed by evaluate_rates as numpy
+        arrays, so the rates can be evaluated together instead of one
+        at a time"""
+        self._prefactor = np.array([r.prefactor for r in self.rates], dtype=np.float64)
+
+        # there are only a few distinct density exponents, so we
+        # compute the density powers once for each and gather them
+        unique_exps = sorted({r.dens_exp for r in self.rates})
+        self._unique_dens_exps = np.array(unique_exps, dtype=np.float64)
+        self._dens_exp_bucket = np.array([unique_exps.index(r.dens_exp) for r in self.rates],
+                                         dtype=np.int64)
+
+        # each row holds the indices into unique_nuclei of a rate's
+        # reactants.  Unused slots point one past the last nucleus,
+        # where evaluate_rates stores a molar fraction of 1
+        nuc_index = {n: i for i, n in enumerate(self.unique_nuclei)}
+        max_reactants = max([len(r.reactants) for r in self.rates] + [1])
+        self._reactant_idx = np.full((len(self.rates), max_reactants),
+                                     len(self.unique_nuclei), dtype=np.int64)
+        for i, r in enumerate(self.rates):
+            for j, n in enumerate(r.reactants):
+                self._reactant_idx[i, j] = nuc_index[n]
+
+    def _setup_plot_topology(self):
+        """find the nuclei and links shown by plot.  These only depend on
+        the rates, so they are computed once here."""
+
+        # nodes -- the node nuclei will be all of the heavies, but not
+        # p, n, alpha, unless we have p + p, 3-a, etc.
+        repeated = set()
+        for r in self.rates:
+            repeated.update(n for n in r.reactants if r.reactants.count(n) > 1)
+
+        self._node_nuclei = [n for n in self.unique_nuclei
+                             if n.raw not in ["p", "n", "he4"] or n in repeated]
+        self._node_position = {n: (n.N, n.Z) for n in self._node_nuclei}
+
+        # edges -- each link from a node nucleus to a node nucleus it
+        # produces, together with the index into self.rates of the rate
+        # responsible for it
+        rate_index = {r: i for i, r in enumerate(self.rates)}
+        node_set = set(self._node_nuclei)
+        self._edge_list = [(n, p, rate_index[r]) for n in self._node_nuclei
+                           for r in self.nuclei_consumed[n]
+                           for p in r.products if p in node_set]
+
     def _read_rate_files(self, rate_files):
         # get the rates
         self.files = rate_files
@@ -200,34 +318,160 @@ class RateCollection(object):
         """ get all the nuclei that are part of the network """
         return self.unique_nuclei
 
-    def evaluate_rates(self, rho, T, composition):
+    def _get_reactant_idx(self, composition):
+        """return the reactant index table with the nuclei indexed in
+        the order of the composition rather than unique_nuclei, so the
+        composition's molar fractions can be used without reordering.
+        The unused slots point one past the composition's last nucleus.
+        This only depends on the composition's nuclei, so it is cached."""
+        try:
+            return self._comp_reactant_idx[composition._nuclei]
+        except KeyError:
+            gather = [composition._index[n.raw] for n in self.unique_nuclei]
+            gather.append(len(composition._nuclei))
+            reactant_idx = np.array(gather, dtype=np.int64)[self._reactant_idx]
+            self._comp_reactant_idx[composition._nuclei] = reactant_idx
+            return reactant_idx
+
+    def _get_rate_table(self):
+        """return the log of the temperature-dependent part of each
+        rate tabulated on a uniform grid in log10(T), building it on
+        first use"""
+        if self._rate_table is None:
+            logT_min, logT_max = self.rate_table_logT
+            logT_grid = np.linspace(logT_min, logT_max, self.rate_table_npts)
+            table = np.empty((len(self.rates), len(logT_grid)), dtype=np.float64)
+            for j, logT in enumerate(logT_grid):
+                tf = Tfactors(10.0**logT)
+                table[:, j] = [r.eval_tf(tf) for r in self.rates]
+
+            # rates that vanish everywhere (e.g. tabular rates) are
+            # flagged so we can return exactly zero for them
+            self._rate_table_zero = np.all(table == 0.0, axis=1)
+            self._rate_table = np.log(np.maximum(table, np.finfo(np.float64).tiny))
+
+        return self._rate_table
+
+    def _eval_T_rates(self, T, use_table=False):
+        """evaluate the temperature-dependent part of each rate, either
+        directly or by interpolating in the rate table"""
+        logT_min, logT_max = self.rate_table_logT
+        if use_table and logT_min <= math.log10(T) <= logT_max:
+            table = self._get_rate_table()
+            dlogT = (logT_max - logT_min)/(self.rate_table_npts - 1)
+            x = (math.log10(T) - logT_min)/dlogT
+            i = min(int(x), self.rate_table_npts - 2)
+            f = x - i
+            T_rates = np.exp((1.0 - f)*table[:, i] + f*table[:, i+1])
+            T_rates[self._rate_table_zero] = 0.0
+            return T_rates
+
+        # the temperature factors are shared by all the rates
+        tf = Tfactors(T)
+        return np.fromiter((r.eval_tf(tf) for r in self.rates),
+                           dtype=np.float64, count=len(self.rates))
+
+    def prepare_composition(self, composition):
+        """return the composition-dependent part of the rates, the
+        product of the molar fractions of the reactants of each rate.
+        This can be reused with evaluate_at for any rho and T as long
+        as the composition doesn't change."""
+
+        # the molar fractions, with a trailing 1 for the unused
+        # reactant slots
+        ys_arr = np.append(composition.get_molar_array(), 1.0)
+        reactant_idx = self._get_reactant_idx(composition)
+
+        yfac = ys_arr[reactant_idx].prod(axis=1)
+        yfac.flags.writeable = False
+        return yfac
+
+    def evaluate_at(self, yfac, rho, T, use_table=False):
+        """evaluate the rates for a specific density and temperature,
+        given the composition-dependent part of the rates, yfac, from
+        prepare_composition.  The rates are returned as an array
+        ordered like self.rates.  Results are cached, so revisiting a
+        state (e.g. moving an Explorer slider back and forth) is cheap.
+        The returned array is the cached one, shared between calls, so
+        it is read-only -- copy it if you need to modify it.
+
+        If use_table is True, the temperature dependence of the rates
+        is interpolated from a tabulation in log10(T) instead of being
+        evaluated directly.  This only pays off when many different
+        temperatures are evaluated, and it is approximate: between the
+        grid points the rates can be off by up to about 5% (more for
+        rates that are close to underflowing).
+
+        rho and T may also be arrays (broadcast against each other), in
+        which case each rate's entry is an array of that shape; the
+        table and the cache are only used for scalar rho and T."""
+        # arrays can't be hashed, so only scalar states are cached
+        if not np.ndim(rho) == np.ndim(T) == 0:
+            return self._evaluate_at_array(yfac, rho, T)
+
+        key = (rho, T, use_table, yfac.tobytes())
+        if key in self._eval_cache:
+            return self._eval_cache[key]
+
+        T_rates = self._eval_T_rates(T, use_table=use_table)
+
+        rho_pow = (rho**self._unique_dens_exps)[self._dens_exp_bucket]
+
+        rvals_arr = self._prefactor * rho_pow * T_rates * yfac
+
+        # the cached array is shared, so make sure it isn't modified
+        rvals_arr.flags.writeable = False
+
+        if len(self._eval_cache) >= self.eval_cache_size:
+            self._eval_cache.clear()
+        self._eval_cache[key] = rvals_arr
+
+        return rvals_arr
+
+    def _evaluate_at_array(self, yfac, rho, T):
+        """evaluate the rates as in evaluate_at for arrays of rho and T.
+        The result has the rate axis first, followed by the broadcast
+        shape of rho and T."""
+        rho = np.asarray(rho, dtype=np.float64)
+        T = np.asarray(T, dtype=np.float64)
+        shape = np.broadcast(rho, T).shape
+
+        tf = Tfactors(T)
+        T_rates = np.empty((len(self.rates),) + shape, dtype=np.float64)
+        for i, r in enumerate(self.rates):
+            T_rates[i] = r.eval_tf(tf)
+
+        # give the per-rate factors trailing axes so they broadcast
+        # against rho and T rather than along them
+        per_rate = (len(self.rates),) + (1,)*len(shape)
+        dens_exp = self._unique_dens_exps[self._dens_exp_bucket].reshape(per_rate)
+
+        prefactor = self._prefactor.reshape(per_rate)
+        return prefactor * rho**dens_exp * T_rates * yfac.reshape(per_rate)
+
+    def evaluate_rates(self, rho, T, composition, use_table=False):
         """evaluate the rates for a specific density, temperature, and
-        composition"""
-        rvals = OrderedDict()
-        ys = composition.get_molar()
-
-        for r in self.rates:
-            val = r.prefactor * rho**r.dens_exp * r.eval(T)
-            yfac = functools.reduce(mul, [ys[q] for q in r.reactants])
-            rvals[r] = yfac * val
-
-        return rvals
+        composition, returning a dictionary keyed on the rates.  See
+        evaluate_at for the meaning of use_table."""
+        yfac = self.prepare_composition(composition)
+        rvals_arr = self.evaluate_at(yfac, rho, T, use_table=use_table)
+        return OrderedDict(zip(self.rates, rvals_arr))
 
     def network_overview(self):
         """ return a verbose network overview """
-        ostr = ""
+        parts = []
         for n in self.unique_nuclei:
-            ostr += "{}\n".format(n)
-            ostr += "  consumed by:\n"
+            parts.append("{}\n".format(n))
+            parts.append("  consumed by:\n")
             for r in self.nuclei_consumed[n]:
-                ostr += "     {}\n".format(r.string)
+                parts.append("     {}\n".format(r.string))
 
-            ostr += "  produced by:\n"
+            parts.append("  produced by:\n")
             for r in self.nuclei_produced[n]:
-                ostr += "     {}\n".format(r.string)
+                parts.append("     {}\n".format(r.string))
 
-            ostr += "\n"
-        return ostr
+            parts.append("\n")
+        return "".join(parts)
 
     def write_network(self, *args, **kwargs):
         """Before writing the network, check to make sure the rates
@@ -238,8 +482,7 @@ class RateCollection(object):
     def _distinguishable_rates(self):
         """Every Rate in this RateCollection should have a unique Rate.fname,
         as the network writers distinguish the rates on this basis."""
-        names = [r.fname for r in self.rates]
-        return len(set(names)) == len(self.rates)
+        return self._distinguishable
 
     def _write_network(self, *args, **kwargs):
         """A stub for function to output the network -- this is implementation
@@ -247,82 +490,113 @@ class RateCollection(object):
         print('To create network integration source code, use a class that implements a specific network type.')
         return
 
-    def plot(self, outfile=None, rho=None, T=None, comp=None, size=(800, 600), dpi=100):
-        """Make a plot of the network structure showing the links between nuclei"""
+    def plot(self, outfile=None, rho=None, T=None, comp=None, size=(800, 600), dpi=100,
+             use_table=False, ax=None):
+        """Make a plot of the network structure showing the links between nuclei.
+        If rho, T, and comp are given, the links are colored by the rates,
+        which are interpolated from a table if use_table is True.  If ax
+        is given, the plot is drawn on that matplotlib Axes, and its
+        figure is left at its current size."""
+
+        if rho is not None and T is not None and comp is not None:
+            yfac = self.prepare_composition(comp)
+            ydots = self.evaluate_at(yfac, rho, T, use_table=use_table)
+        else:
+            ydots = None
+
+        if ax is None:
+            fig, ax = plt.subplots()
+            fig.set_size_inches(size[0]/dpi, size[1]/dpi)
+        else:
+            fig = ax.figure
+
+        self._plot_static(ax)
+        _, pc = self._plot_edges(ax, ydots)
+
+        if pc is not None:
+            fig.colorbar(pc, ax=ax, label="log10(rate)")
+
+        if outfile is None:
+            plt.show()
+        else:
+            fig.tight_layout()
+            fig.savefig(outfile, dpi=dpi)
+
+    def _plot_static(self, ax):
+        """draw the parts of the network plot that don't depend on the
+        rates -- the nuclei, their labels, and the axes"""
 
         G = nx.MultiDiGraph()
-        G.position = {}
-        G.labels = {}
+        G.add_nodes_from(self._node_nuclei)
+        labels = {n: r"${}$".format(n.pretty) for n in self._node_nuclei}
 
-        fig, ax = plt.subplots()
-        #divider = make_axes_locatable(ax)
-        #cax = divider.append_axes('right', size='15%', pad=0.05)
+        # networkx doesn't take a zorder, so we set it on the
+        # returned artists
+        nodes = nx.draw_networkx_nodes(G, self._node_position,
+                                       node_color="#A0CBE2", alpha=1.0,
+                                       node_shape="o", node_size=1000, linewidths=2.0, ax=ax)
+        nodes.set_zorder(10)
 
-        ax.plot([0, 0], [8, 8], 'b-')
+        texts = nx.draw_networkx_labels(G, self._node_position, labels,
+                                        font_size=13, font_color="w", ax=ax)
+        for t in texts.values():
+            t.set_zorder(100)
 
-        # nodes -- the node nuclei will be all of the heavies, but not
-        # p, n, alpha, unless we have p + p, 3-a, etc.
-        node_nuclei = []
-        for n in self.unique_nuclei:
-            if n.raw not in ["p", "n", "he4"]:
-                node_nuclei.append(n)
-            else:
-                for r in self.rates:
-                    if r.reactants.count(n) > 1:
-                        node_nuclei.append(n)
-                        break
+        Ns = [n.N for n in self._node_nuclei]
+        Zs = [n.Z for n in self._node_nuclei]
 
-        for n in node_nuclei:
-            G.add_node(n)
-            G.position[n] = (n.N, n.Z)
-            G.labels[n] = r"${}$".format(n.pretty)
+        ax.set_xlim(min(Ns)-1, max(Ns)+1)
+        #ax.set_ylim(min(Zs)-1, max(Zs)+1)
+        ax.set_xlabel(r"$N$", fontsize="large")
+        ax.set_ylabel(r"$Z$", fontsize="large")
 
-        if rho is not None and T is not None and comp is not None:
-            ydots = self.evaluate_rates(rho, T, comp)
-        else:
-            ydots = None
+        ax.spines['right'].set_visible(False)
+        ax.spines['top'].set_visible(False)
 
-        #for rr in ydots:
-        #    print("{}: {}".format(rr, ydots[rr]))
+        ax.set_aspect("equal", "datalim")
 
-        # edges
-        for n in node_nuclei:
-            for r in self.nuclei_consumed[n]:
-                for p in r.products:
-                    if p in node_nuclei:
-                        # networkx doesn't seem to keep the edges in
-                        # any particular order, so we associate data
-                        # to the edges here directly, in this case,
-                        # the reaction rate, which will be used to
-                        # color it
-                        if ydots is None:
-                            G.add_edges_from([(n, p)], weight=0.5)
-                        else:
-                            try:
-                                rate_weight = math.log10(ydots[r])
-                            except ValueError:
-                                # if ydots[r] is zero, then set the weight
-                                # to roughly the minimum exponent possible
-                                # for python floats
-                                rate_weight = -308
-                            except:
-                                raise
-                            G.add_edges_from([(n, p)], weight=rate_weight)
-
-        nx.draw_networkx_nodes(G, G.position,
-                               node_color="#A0CBE2", alpha=1.0,
-                               node_shape="o", node_size=1000, linewidth=2.0, zorder=10, ax=ax)
-
-        nx.draw_networkx_labels(G, G.position, G.labels,
-                                font_size=13, font_color="w", zorder=100, ax=ax)
+    def _plot_edges(self, ax, ydots):
+        """draw the links between the nuclei, colored by the rates in
+        the array ydots (ordered like self.rates) unless it is None.
+        Return the drawn edges and, if ydots is given, a
+        PatchCollection that can be used for a colorbar"""
+
+        G = nx.MultiDiGraph()
+        G.add_nodes_from(self._node_nuclei)
+
+        if ydots is not None:
+            # if a rate is zero, then set the weight to roughly the
+            # minimum exponent possible for python floats
+            log_rates = np.log10(np.maximum(ydots, 1.e-308))
+
+        for n, p, i in self._edge_list:
+            # networkx doesn't seem to keep the edges in
+            # any particular order, so we associate data
+            # to the edges here directly, in this case,
+            # the reaction rate, which will be used to
+            # color it
+            if ydots is None:
+                G.add_edges_from([(n, p)], weight=0.5)
+            else:
+                G.add_edges_from([(n, p)], weight=log_rates[i])
 
         # get the edges and weights coupled in the same order
         edges, weights = zip(*nx.get_edge_attributes(G, 'weight').items())
 
-        edges_lc = nx.draw_networkx_edges(G, G.position, width=3,
+        edges_lc = nx.draw_networkx_edges(G, self._node_position, width=3,
                                           edgelist=edges, edge_color=weights,
                                           node_size=1000,
-                                          edge_cmap=plt.cm.viridis, zorder=1, ax=ax)
+                                          edge_cmap=plt.cm.viridis, ax=ax)
+        if isinstance(edges_lc, list):
+            for e in edges_lc:
+                e.set_zorder(1)
+        else:
+            edges_lc.set_zorder(1)
+
+        # newer networkx hides the ticks whenever it draws, so we set
+        # them after the edges
+        ax.xaxis.set_ticks_position('bottom')
+        ax.yaxis.set_ticks_position('left')
 
         # for networkx <= 2.0 draw_networkx_edges returns a
         # LineCollection matplotlib type which we can use for the
@@ -331,55 +605,61 @@ class RateCollection(object):
         # PatchCollection.  See: 
         # https://stackoverflow.com/questions/18658047/adding-a-matplotlib-colorbar-from-a-patchcollection
 
+        pc = None
         if ydots is not None:
             pc = mpl.collections.PatchCollection(edges_lc, cmap=plt.cm.viridis)
-            pc.set_array(weights)
-            plt.colorbar(pc, label="log10(rate)")
-
-        Ns = [n.N for n in node_nuclei]
-        Zs = [n.Z for n in node_nuclei]
-
-        plt.xlim(min(Ns)-1, max(Ns)+1)
-        #plt.ylim(min(Zs)-1, max(Zs)+1)
-        plt.xlabel(r"$N$", fontsize="large")
-        plt.ylabel(r"$Z$", fontsize="large")
-
-        ax.spines['right'].set_visible(False)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['top'].set_visible(False)
-        ax.xaxis.set_ticks_position('bottom')
-        ax.yaxis.set_ticks_position('left')
-
-        ax.set_aspect("equal", "datalim")
-
-        fig.set_size_inches(size[0]/dpi, size[1]/dpi)
+            pc.set_array(np.array(weights))
+            pc.autoscale_None()
 
-        if outfile is None:
-            plt.show()
-        else:
-            plt.tight_layout()
-            plt.savefig(outfile, dpi=dpi)
+        return edges_lc, pc
 
     def __repr__(self):
-        string = ""
-        for r in self.rates:
-            string += "{}\n".format(r.string)
-        return string
+        return "".join("{}\n".format(r.string) for r in self.rates)
 
 
 class Explorer(object):
     """ interactively explore a rate collection """
-    def __init__(self, rc, comp, size=(800, 600)):
-        """ take a RateCollection and a composition """
+    def __init__(self, rc, comp, size=(800, 600), dpi=100):
+        """ take a RateCollection and a composition.  The composition
+        is fixed for the exploration, so only the density and
+        temperature dependence of the rates is reevaluated.  size is
+        in pixels, at the given dpi, as for RateCollection.plot """
         self.rc = rc
         self.comp = comp
         self.size = size
+        self.dpi = dpi
+
+        self._yfac = self.rc.prepare_composition(self.comp)
+
+        # the nuclei and axes are drawn once, and only the edges and
+        # colorbar are updated as the sliders move.  The figure is
+        # closed so pyplot doesn't show it on its own -- we display
+        # it after each update instead
+        self.fig, self.ax = plt.subplots(figsize=(size[0]/dpi, size[1]/dpi), dpi=dpi)
+        self.rc._plot_static(self.ax)
+        plt.close(self.fig)
+
+        self._last_edges = None
+        self._colorbar = None
 
     def _make_plot(self, logrho, logT):
-        self.rc.plot(rho=10.0**logrho, T=10.0**logT, comp=self.comp, size=self.size)
+        ydots = self.rc.evaluate_at(self._yfac, 10.0**logrho, 10.0**logT)
+
+        if self._last_edges is not None:
+            if isinstance(self._last_edges, list):
+                for e in self._last_edges:
+                    e.remove()
+            else:
+                self._last_edges.remove()
+
+        self._last_edges, pc = self.rc._plot_edges(self.ax, ydots)
+
+        if self._colorbar is None:
+            self._colorbar = self.fig.colorbar(pc, ax=self.ax, label="log10(rate)")
+        else:
+            self._colorbar.update_normal(pc)
+
+        display(self.fig)
 
     def explore(self, logrho=(2, 6, 0.1), logT=(7, 9, 0.1)):
         """Perform interactive exploration of the network structure."""
@@ -1,7 +1,11 @@
 # unit tests for rates
+import matplotlib.pyplot as plt
+
 import pynucastro.networks as networks
 import pynucastro.rates as rates
 
+import numpy as np
+
 from pytest import approx
 
 
@@ -41,6 +45,16 @@ class TestComposition(object):
         assert sum == approx(1.0)
         assert self.comp.X[rates.Nucleus("h1")] == approx(0.7)
 
+    def test_solar_p(self):
+        # protons named p rather than h1
+        nuclei = [rates.Nucleus("p"), rates.Nucleus("he4"), rates.Nucleus("c12")]
+        comp = networks.Composition(nuclei)
+        comp.set_solar_like(Z=0.02)
+
+        assert comp.X[nuclei[0]] == approx(0.7)
+        assert comp.X[nuclei[1]] == approx(0.3 - 0.02)
+        assert comp.X[nuclei[2]] == approx(0.02)
+
     def test_set_all(self):
         val = 1.0/len(self.nuclei)
         self.comp.set_all(1.0/len(self.nuclei))
@@ -52,6 +66,19 @@ class TestComposition(object):
         self.comp.set_nuc(n.raw, 0.55)
         assert self.comp.X[n] == 0.55
 
+    def test_set_X(self):
+        n = self.nuclei[2]
+        self.comp.X[n] = 0.25
+        assert self.comp.X_arr[2] == 0.25
+        assert len(self.comp.X) == len(self.nuclei)
+
+    def test_assign_X(self):
+        self.comp.set_all(0.1)
+        self.comp.X = {self.nuclei[1]: 0.3, self.nuclei[3]: 0.2}
+        assert self.comp.X[self.nuclei[1]] == 0.3
+        assert self.comp.X[self.nuclei[3]] == 0.2
+        assert self.comp.X[self.nuclei[0]] == 0.1
+
     def test_get_molar(self):
         self.comp.set_solar_like(Z=0.02)
         molar = self.comp.get_molar()
@@ -118,6 +145,166 @@ class TestRateCollection(object):
         for r in rv:
             assert rv[r] == approx(rates[str(r)])
 
+    def test_eval_repeated_reactants(self):
+        rc = networks.RateCollection(["he4-aag-c12-fy05", "c12-ag-o16-nac2"])
+        c = networks.Composition(rc.unique_nuclei)
+        c.set_solar_like()
+        ys = c.get_molar()
+
+        rho = 1.e6
+        T = 2.e8
+        rv = rc.evaluate_rates(rho, T, c)
+
+        for r in rc.rates:
+            yfac = 1.0
+            for n in r.reactants:
+                yfac *= ys[n]
+            assert rv[r] == approx(r.prefactor * rho**r.dens_exp * r.eval(T) * yfac)
+
+    def test_eval_composition_order(self):
+        c1 = networks.Composition(self.rc.unique_nuclei)
+        c1.set_solar_like()
+
+        # the same mass fractions, with the nuclei in a different order
+        # and an extra nucleus not in the network
+        c2 = networks.Composition([rates.Nucleus("fe56")] + self.rc.unique_nuclei[::-1])
+        for n in self.rc.unique_nuclei:
+            c2.X[n] = c1.X[n]
+
+        rv1 = self.rc.evaluate_rates(1.e4, 1.e8, c1)
+        rv2 = self.rc.evaluate_rates(1.e4, 1.e8, c2)
+        for r in rv1:
+            assert rv2[r] == approx(rv1[r])
+
+    def test_evaluate_at(self):
+        c = networks.Composition(self.rc.unique_nuclei)
+        c.set_solar_like()
+
+        yfac = self.rc.prepare_composition(c)
+        for rho, T in [(1.e4, 1.e8), (1.e6, 3.e8)]:
+            rv = self.rc.evaluate_rates(rho, T, c)
+            rv_arr = self.rc.evaluate_at(yfac, rho, T)
+            for n, r in enumerate(self.rc.rates):
+                assert rv_arr[n] == approx(rv[r])
+
+    def test_evaluate_at_array(self):
+        c = networks.Composition(self.rc.unique_nuclei)
+        c.set_solar_like()
+        yfac = self.rc.prepare_composition(c)
+
+        # as many temperatures as rates, so broadcasting along the
+        # wrong axis would go unnoticed by the shapes alone
+        nrates = len(self.rc.rates)
+        rhos = np.logspace(3, 6, nrates)
+        Ts = np.logspace(7.5, 9, nrates)
+
+        rv_arr = self.rc.evaluate_at(yfac, rhos, Ts)
+        assert rv_arr.shape == (nrates, nrates)
+
+        for j, (rho, T) in enumerate(zip(rhos, Ts)):
+            rv = self.rc.evaluate_at(yfac, rho, T)
+            assert rv_arr[:, j] == approx(rv)
+
+    def test_eval_rates_array(self):
+        c = networks.Composition(self.rc.unique_nuclei)
+        c.set_solar_like()
+
+        rhos = np.array([1.e4, 1.e5])
+        Ts = np.array([1.e8, 2.e8])
+
+        ncached = len(self.rc._eval_cache)
+        rv = self.rc.evaluate_rates(rhos, Ts, c)
+        assert len(self.rc._eval_cache) == ncached
+
+        for j in range(len(rhos)):
+            rv_j = self.rc.evaluate_rates(rhos[j], Ts[j], c)
+            for r in self.rc.rates:
+                assert rv[r].shape == rhos.shape
+                assert rv[r][j] == approx(rv_j[r])
+
+    def test_eval_table(self):
+        c = networks.Composition(self.rc.unique_nuclei)
+        c.set_solar_like()
+
+        yfac = self.rc.prepare_composition(c)
+
+        # sweep densely across the table, including between grid
+        # points, ignoring rates close to underflow
+        logT_min, logT_max = self.rc.rate_table_logT
+        for logT in np.linspace(logT_min, logT_max, 1001):
+            rv = self.rc.evaluate_at(yfac, 1.e4, 10.0**logT)
+            rv_tab = self.rc.evaluate_at(yfac, 1.e4, 10.0**logT, use_table=True)
+            valid = rv > 1.e-280
+            assert rv_tab[valid] == approx(rv[valid], rel=5.e-2)
+
+    def test_eval_cache(self):
+        c = networks.Composition(self.rc.unique_nuclei)
+        c.set_solar_like()
+
+        rv1 = self.rc.evaluate_rates(1.e4, 1.e8, c)
+        ncached = len(self.rc._eval_cache)
+        rv2 = self.rc.evaluate_rates(1.e4, 1.e8, c)
+        assert rv1 == rv2
+        assert len(self.rc._eval_cache) == ncached
+
+        # a cache hit returns the same, read-only array
+        yfac = self.rc.prepare_composition(c)
+        rv_arr = self.rc.evaluate_at(yfac, 1.e4, 1.e8)
+        assert self.rc.evaluate_at(yfac, 1.e4, 1.e8) is rv_arr
+        assert not rv_arr.flags.writeable
+
+        # changing the composition must not return the cached rates
+        c.set_all(0.1)
+        rv3 = self.rc.evaluate_rates(1.e4, 1.e8, c)
+        r = self.rc.nuclei_consumed[self.c12][0]
+        assert rv3[r] != approx(rv1[r])
+
+    def test_plot_ax(self, tmp_path):
+        c = networks.Composition(self.rc.unique_nuclei)
+        c.set_solar_like()
+
+        fig1, ax1 = plt.subplots()
+        fig2, ax2 = plt.subplots()
+        fig1_size = tuple(fig1.get_size_inches())
+
+        outfile = str(tmp_path / "plot.png")
+        self.rc.plot(outfile=outfile, rho=1.e4, T=1.e8, comp=c, ax=ax1)
+
+        # the figure we passed in is the one saved, and it isn't resized
+        assert tuple(fig1.get_size_inches()) == fig1_size
+        assert len(ax1.patches) == len(self.rc._edge_list)
+        assert len(ax2.patches) == 0
+
+        ref_file = str(tmp_path / "ref.png")
+        fig1.savefig(ref_file, dpi=100)
+        assert np.array_equal(plt.imread(outfile), plt.imread(ref_file))
+
+        plt.close(fig1)
+        plt.close(fig2)
+
+    def test_explorer(self):
+        c = networks.Composition(self.rc.unique_nuclei)
+        c.set_solar_like()
+
+        e = networks.Explorer(self.rc, c)
+        yfac = self.rc.prepare_composition(c)
+
+        e._make_plot(4.0, 7.5)
+        first_edges = list(e._last_edges)
+
+        e._make_plot(5.0, 8.5)
+
+        # the old edges are gone and only the new ones are drawn
+        assert len(e.ax.patches) == len(self.rc._edge_list)
+        for edge in first_edges:
+            assert edge not in e.ax.patches
+
+        # the colorbar follows the new rates
+        ydots = self.rc.evaluate_at(yfac, 10.0**5.0, 10.0**8.5)
+        log_rates = [np.log10(max(ydots[i], 1.e-308)) for _, _, i in self.rc._edge_list]
+        assert e._colorbar.norm.vmin == approx(min(log_rates))
+        assert e._colorbar.norm.vmax == approx(max(log_rates))
+
     def test_overview(self):
 
         ostr = """
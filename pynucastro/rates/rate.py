@@ -1060,7 +1060,11 @@ class Rate(object):
 
     def eval(self, T):
         """ evauate the reaction rate for temperature T """
-        tf = Tfactors(T)
+        return self.eval_tf(Tfactors(T))
+
+    def eval_tf(self, tf):
+        """ evaluate the reaction rate given the temperature factors tf
+        (a Tfactors object), which can be shared between rates """
         r = 0.0
         for s in self.sets:
             f = s.f()
@@ -232,3 +232,7 @@ class TestRate(object):
 
     def test_eval(self):
         assert self.rate8.eval(1.e8) == approx(2.0403192412842946e-24)
+
+    def test_eval_tf(self):
+        tf = rates.Tfactors(1.e8)
+        assert self.rate8.eval_tf(tf) == approx(self.rate8.eval(1.e8))